@@ -1,6 +1,7 @@
 import os, re
 from datetime import datetime, timedelta
-from typing import Dict, Any, List
+from itertools import islice
+from typing import Dict, Any, List, Iterator, Optional
 from langchain_openai import ChatOpenAI
 from calendar_service import GoogleCalendarService
 
@@ -11,10 +12,14 @@ class ConversationState:
         self.extracted_datetime: datetime = None
         self.duration: int = 60
         self.available_slots: List[Dict[str, str]] = []
+        # Resumable slot search; "show more" continues from where the last page stopped
+        self.slot_cursor: Optional[Iterator[Dict[str, str]]] = None
         self.selected_slot: Dict[str, str] = None
         self.booking_confirmed: bool = False
 
 class AppointmentBookingAgent:
+    SLOTS_PER_PAGE = 5
+
     def __init__(self, openai_api_key=None):
         self.calendar_service = GoogleCalendarService()
         if openai_api_key:
@@ -23,12 +28,28 @@ class AppointmentBookingAgent:
             self.llm = None
         self.state = ConversationState()
 
+    def _next_slot_page(self) -> List[Dict[str, str]]:
+        """Pull the next page of slots from the session cursor"""
+        if self.state.slot_cursor is None:
+            return []
+        return list(islice(self.state.slot_cursor, self.SLOTS_PER_PAGE))
+
+    def _format_slots(self, slots: List[Dict[str, str]]) -> str:
+        return "Available slots:\n" + "\n".join(
+            f"{i+1}. {s['display']}" for i, s in enumerate(slots)
+        ) + "\nWhich slot would you prefer?"
+
     def process_message(self, message: str) -> Dict[str, Any]:
         self.state.messages.append({"role": "user", "content": message})
         last = message.lower()
 
         # Intent detection
-        if any(w in last for w in ["book", "schedule", "appointment", "meeting"]):
+        wants_booking = any(w in last for w in ["book", "schedule", "appointment", "meeting"])
+        picks_or_declines = re.search(r"confirm|yes|book it|cancel|\bno\b|\d", last)
+        if (self.state.slot_cursor is not None and not wants_booking and not picks_or_declines
+                and re.search(r"\b(more|others?)\b", last)):
+            intent = "more_slots"
+        elif wants_booking:
             intent = "book_appointment"
         elif any(w in last for w in ["available", "free", "time"]):
             intent = "check_availability"
@@ -48,15 +69,20 @@ class AppointmentBookingAgent:
         # Flow logic
         response = ""
         if intent in ["book_appointment", "check_availability"]:
-            slots = self.calendar_service.find_available_slots(dt, dt + timedelta(days=7), 60)
+            self.state.slot_cursor = self.calendar_service.iter_available_slots(dt, dt + timedelta(days=7), 60)
+            slots = self._next_slot_page()
             self.state.available_slots = slots
             if slots:
-                response = "Available slots:\n" + "\n".join(
-                    f"{i+1}. {s['display']}" for i, s in enumerate(slots[:5])
-                )
-                response += "\nWhich slot would you prefer?"
+                response = self._format_slots(slots)
             else:
                 response = "No available slots found in that period."
+        elif intent == "more_slots":
+            slots = self._next_slot_page()
+            if slots:
+                self.state.available_slots = slots
+                response = self._format_slots(slots)
+            else:
+                response = "No more available slots in that period. Would you like to try a different week?"
         elif intent == "confirm_booking":
             nums = re.findall(r"\d+", last)
             if nums and self.state.available_slots:
@@ -70,6 +96,7 @@ class AppointmentBookingAgent:
                     )
                     if success:
                         response = f"Booked for {sel['display']}."
+                        self.state.slot_cursor = None
                     else:
                         response = "Booking failed. Try again."
                     self.state.booking_confirmed = success
@@ -78,6 +105,7 @@ class AppointmentBookingAgent:
             else:
                 response = "Please select a valid slot number."
         elif intent == "modify_request":
+            self.state.slot_cursor = None
             response = "Okay, let’s pick a new time. When would you like?"
         else:
             response = "Hi! I can help you check availability or book appointments. When would work for you?"
@@ -1,7 +1,8 @@
 import os
 import json
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from itertools import islice
+from typing import List, Dict, Any, Iterator
 from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
 from google_auth_oauthlib.flow import InstalledAppFlow
@@ -10,6 +11,7 @@ from googleapiclient.errors import HttpError
 
 class GoogleCalendarService:
     SCOPES = ['https://www.googleapis.com/auth/calendar']
+    MAX_SLOTS = 10
     
     def __init__(self, credentials_file: str = "credentials.json", token_file: str = "token.json"):
         self.credentials_file = credentials_file
@@ -63,9 +65,20 @@ class GoogleCalendarService:
     
     def find_available_slots(self, start_date: datetime, end_date: datetime, 
                            duration_minutes: int = 60) -> List[Dict[str, str]]:
-        """Find available time slots in the given date range"""
+        """Find up to MAX_SLOTS available time slots in the given date range"""
+        return list(islice(self.iter_available_slots(start_date, end_date, duration_minutes), self.MAX_SLOTS))
+    
+    def iter_available_slots(self, start_date: datetime, end_date: datetime,
+                             duration_minutes: int = 60) -> Iterator[Dict[str, str]]:
+        """Lazily yield available time slots, querying free/busy only once"""
         busy_times = self.get_free_busy(start_date, end_date)
-        available_slots = []
+        
+        # Parse busy intervals once instead of for every candidate slot
+        busy_intervals = [
+            (datetime.fromisoformat(busy['start'].replace('Z', '+00:00')),
+             datetime.fromisoformat(busy['end'].replace('Z', '+00:00')))
+            for busy in busy_times
+        ]
         
         current_time = start_date
         while current_time < end_date:
@@ -73,10 +86,7 @@ class GoogleCalendarService:
             
             # Check if this slot conflicts with busy times
             is_available = True
-            for busy in busy_times:
-                busy_start = datetime.fromisoformat(busy['start'].replace('Z', '+00:00'))
-                busy_end = datetime.fromisoformat(busy['end'].replace('Z', '+00:00'))
-                
+            for busy_start, busy_end in busy_intervals:
                 if (current_time < busy_end and slot_end > busy_start):
                     is_available = False
                     break
@@ -84,15 +94,13 @@ class GoogleCalendarService:
             # Only include slots during business hours (9 AM - 5 PM)
             if (is_available and 9 <= current_time.hour < 17 and 
                 current_time.weekday() < 5):  # Monday = 0, Sunday = 6
-                available_slots.append({
+                yield {
                     'start': current_time.strftime('%Y-%m-%d %H:%M'),
                     'end': slot_end.strftime('%Y-%m-%d %H:%M'),
                     'display': current_time.strftime('%B %d, %Y at %I:%M %p')
-                })
+                }
             
             current_time += timedelta(minutes=30)  # Check every 30 minutes
-        
-        return available_slots[:10]  # Return max 10 slots
     
     def book_appointment(self, start_time: datetime, end_time: datetime, 
                         title: str, description: str = "") -> bool:
@@ -0,0 +1,76 @@
+from unittest import mock
+
+import pytest
+
+pytest.importorskip("langchain_openai")
+pytest.importorskip("googleapiclient")
+
+from agent import AppointmentBookingAgent
+from calendar_service import GoogleCalendarService
+
+
+@pytest.fixture
+def free_busy():
+    with mock.patch.object(GoogleCalendarService, "_authenticate"), \
+         mock.patch.object(GoogleCalendarService, "get_free_busy", return_value=[]) as get_free_busy:
+        yield get_free_busy
+
+
+def test_show_more_reuses_free_busy_and_numbers_current_page(free_busy):
+    agent = AppointmentBookingAgent()
+    first = agent.process_message("any free time next week")["available_slots"]
+    second = agent.process_message("none of those, show more")["available_slots"]
+    third = agent.process_message("any other times?")["available_slots"]
+
+    assert free_busy.call_count == 1
+    assert len({*first, *second, *third}) == 3 * AppointmentBookingAgent.SLOTS_PER_PAGE
+
+    result = agent.process_message("confirm 2")
+    assert result["booking_confirmed"]
+    assert result["response"] == f"Booked for {third[1]}."
+
+
+def test_new_booking_request_starts_new_search(free_busy):
+    agent = AppointmentBookingAgent()
+    assert "Available slots" in agent.process_message("Can I book one more meeting?")["response"]
+    assert free_busy.call_count == 1
+
+    agent.process_message("any free time next week")
+    agent.process_message("schedule a call with my brothers")
+    assert free_busy.call_count == 3
+
+
+def test_confirm_or_cancel_mentioning_more_is_not_paging(free_busy):
+    agent = AppointmentBookingAgent()
+    first = agent.process_message("any free time next week")["available_slots"]
+
+    result = agent.process_message("yes, number 2 please, no need to show more")
+    assert result["booking_confirmed"]
+    assert result["available_slots"] == first
+
+    agent.process_message("any free time next week")
+    assert "new time" in agent.process_message("no more, cancel")["response"]
+    assert free_busy.call_count == 2
+
+
+def test_more_after_booking_or_cancel_does_not_page_old_search(free_busy):
+    agent = AppointmentBookingAgent()
+    agent.process_message("any free time next week")
+    agent.process_message("confirm 1")
+    assert "Available slots" not in agent.process_message("show more")["response"]
+
+    agent.process_message("any free time next week")
+    agent.process_message("no, cancel that")
+    assert "Available slots" not in agent.process_message("show more")["response"]
+
+
+def test_paging_until_results_run_out(free_busy):
+    agent = AppointmentBookingAgent()
+    agent.process_message("any free time next week")
+    for _ in range(50):
+        result = agent.process_message("show more")
+        if "Available slots" not in result["response"]:
+            break
+    assert result["response"].startswith("No more available slots")
+    assert result["available_slots"]
+    assert free_busy.call_count == 1